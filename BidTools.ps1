@@ -11,11 +11,22 @@ param(
   [string]$BidRoot = "S:\Bid Documents 2026",
   [string]$TemplateRoot = "S:\Bid Documents 2026\26000 Proposal Templates\15 - Folder Structure",
   [string]$WorkbookPath = "S:\Bid Documents 2026\26000 Proposal Templates\Bid List.xlsx",
-  [string]$WorksheetName = "Bid List"
+  [string]$WorksheetName = "Bid List",
+  # Internal: used by Start-BidWorkbookSync to run a sync in a background job.
+  [Parameter(DontShow)]
+  [switch]$SyncOnly,
+  [Parameter(DontShow)]
+  [string[]]$SyncFolderNames
 )
 
 $ErrorActionPreference = "Stop"
 
+# .NET directory APIs and robocopy resolve relative paths against the process
+# directory, not the PowerShell location that Test-Path uses, so pin these
+# down once.
+$BidRoot = $ExecutionContext.SessionState.Path.GetUnresolvedProviderPathFromPSPath($BidRoot)
+$TemplateRoot = $ExecutionContext.SessionState.Path.GetUnresolvedProviderPathFromPSPath($TemplateRoot)
+
 $HeaderDefaults = @(
   "Bid Folder",
   "Bid Number",
@@ -28,28 +39,64 @@ $HeaderDefaults = @(
   "Bid Status"
 )
 
+$DefaultHeaderIndex = @{}
+for ($i = 0; $i -lt $HeaderDefaults.Count; $i++) {
+  $DefaultHeaderIndex[$HeaderDefaults[$i]] = $i + 1
+}
+
+$InvalidNameRunRegex = [regex]::new('[\\/:*?"<>|\s]+')
+$YesRegex = [regex]::new('^(y|yes)$', 'IgnoreCase')
+$NoRegex = [regex]::new('^(n|no)$', 'IgnoreCase')
+$BidNumberPrefixRegex = [regex]::new('^\s*(\d+)\b')
+$BidDateRegex = [regex]::new('^(0?[1-9]|1[0-2])-(0?[1-9]|[12]\d|3[01])$')
+
+# Ordinal (case-sensitive) keys: a plain @{} would fold "md" and "MD" together.
+$MemoCacheSize = 256
+$SanitizeNameCache = New-Object 'System.Collections.Generic.Dictionary[string,string]'
+$BidDateCache = New-Object 'System.Collections.Generic.Dictionary[string,string]'
+
+function Set-CachedValue($cache, [string]$key, [string]$value) {
+  # Bounded memo: start over when full rather than tracking recency.
+  if ($cache.Count -ge $MemoCacheSize) { $cache.Clear() }
+  $cache[$key] = $value
+}
+
 function Sanitize-Name([string]$s) {
   if ($null -eq $s) { return "" }
-  $s = $s -replace '[\\/:*?"<>|]', ' '
-  $s = ($s -replace '\s+', ' ').Trim()
-  return $s
+  $cached = $null
+  if ($SanitizeNameCache.TryGetValue($s, [ref]$cached)) { return $cached }
+  $result = $InvalidNameRunRegex.Replace($s, ' ').Trim()
+  Set-CachedValue $SanitizeNameCache $s $result
+  return $result
+}
+
+function Read-Prompt([string]$prompt) {
+  # Read-Host always reads from the console host. When answers are piped or
+  # redirected in, read lines straight from the buffered stdin reader instead.
+  # GUI hosts such as the ISE report redirected input with an empty stdin, so
+  # only the plain console host takes that path.
+  if ($Host.Name -eq 'ConsoleHost' -and [Console]::IsInputRedirected) {
+    [Console]::Out.Write("${prompt}: ")
+    $line = [Console]::In.ReadLine()
+    if ($null -eq $line) { throw "Input ended while waiting for: $prompt" }
+    return $line
+  }
+  return (Read-Host $prompt)
 }
 
 function Read-YesNoDefaultNo([string]$prompt) {
   while ($true) {
-    $raw = (Read-Host "$prompt (Y/N) [N]").Trim()
+    $raw = (Read-Prompt "$prompt (Y/N) [N]").Trim()
     if ([string]::IsNullOrWhiteSpace($raw)) { return $false }
-    switch -Regex ($raw) {
-      '^(y|yes)$' { return $true }
-      '^(n|no)$'  { return $false }
-      default     { Write-Host "Please enter Y or N (or press Enter for N)." -ForegroundColor Yellow }
-    }
+    if ($YesRegex.IsMatch($raw)) { return $true }
+    if ($NoRegex.IsMatch($raw)) { return $false }
+    Write-Host "Please enter Y or N (or press Enter for N)." -ForegroundColor Yellow
   }
 }
 
 function Read-NonEmpty([string]$prompt) {
   while ($true) {
-    $value = Sanitize-Name (Read-Host $prompt)
+    $value = Sanitize-Name (Read-Prompt $prompt)
     if (![string]::IsNullOrWhiteSpace($value)) { return $value }
     Write-Host "Value is required." -ForegroundColor Yellow
   }
@@ -60,16 +107,27 @@ function Assert-Paths {
   if (!(Test-Path $TemplateRoot)) { throw "TemplateRoot not found: $TemplateRoot" }
 }
 
-function Get-BidFolders {
-  Get-ChildItem -Path $BidRoot -Directory -ErrorAction Stop |
-    Sort-Object Name
+function Get-VisibleBidFolderNames {
+  # Same folder set as Get-ChildItem -Directory: hidden folders are skipped.
+  # Attributes come from the enumeration itself, so there is no extra stat.
+  foreach ($dir in [System.IO.DirectoryInfo]::new($BidRoot).EnumerateDirectories()) {
+    if (($dir.Attributes -band [System.IO.FileAttributes]::Hidden) -eq 0) { $dir.Name }
+  }
+}
+
+function Get-BidFolderNames {
+  $names = [string[]]@(Get-VisibleBidFolderNames)
+  [Array]::Sort($names, [System.StringComparer]::CurrentCultureIgnoreCase)
+  return $names
 }
 
 function Get-NextBidNumber {
+  # Only the largest prefix matters, so walk the names unsorted.
   $max = 0
-  foreach ($f in (Get-BidFolders)) {
-    if ($f.Name -match '^\s*(\d+)\b') {
-      $n = [int]$Matches[1]
+  foreach ($name in (Get-VisibleBidFolderNames)) {
+    $m = $BidNumberPrefixRegex.Match($name)
+    if ($m.Success) {
+      $n = [int]$m.Groups[1].Value
       if ($n -gt $max) { $max = $n }
     }
   }
@@ -78,13 +136,17 @@ function Get-NextBidNumber {
 }
 
 function Normalize-BidDate([string]$bidDateRaw) {
-  if ($bidDateRaw -notmatch '^(0?[1-9]|1[0-2])-(0?[1-9]|[12]\d|3[01])$') {
+  $cached = $null
+  if ($BidDateCache.TryGetValue($bidDateRaw, [ref]$cached)) { return $cached }
+  if (-not $BidDateRegex.IsMatch($bidDateRaw)) {
     throw "Bid Date must be in MM-DD format (ex: 12-5 or 12-05). You entered: $bidDateRaw"
   }
   $parts = $bidDateRaw.Split('-')
   $mm = "{0:D2}" -f [int]$parts[0]
   $dd = "{0:D2}" -f [int]$parts[1]
-  return "$mm-$dd"
+  $result = "$mm-$dd"
+  Set-CachedValue $BidDateCache $bidDateRaw $result
+  return $result
 }
 
 function Build-BidFolderName([int]$bidNumber, [string]$initials, [string]$bidDate, [string]$customer, [string]$bidName) {
@@ -93,7 +155,7 @@ function Build-BidFolderName([int]$bidNumber, [string]$initials, [string]$bidDat
 }
 
 function Parse-BidFolderName([string]$folderName) {
-  $parts = $folderName -split '\s-\s', 5
+  $parts = $folderName.Split([string[]]@(' - '), 5, [System.StringSplitOptions]::None)
   if ($parts.Count -lt 5) { return $null }
   return [pscustomobject]@{
     BidNumber = ($parts[0]).Trim()
@@ -117,9 +179,13 @@ function New-ExcelContext([string]$path) {
   if (!(Test-Path $path)) { throw "Workbook not found: $path" }
   $excel = New-Object -ComObject Excel.Application
   $excel.Visible = $false
+  $excel.DisplayAlerts = $false
   $readOnly = $false
   try {
+    # With alerts off, a workbook locked by another user opens read-only in
+    # this single call rather than failing and being loaded a second time.
     $workbook = $excel.Workbooks.Open($path, $null, $false)
+    $readOnly = [bool]$workbook.ReadOnly
   }
   catch {
     $readOnly = $true
@@ -142,24 +208,40 @@ function New-ExcelContext([string]$path) {
     Worksheet = $worksheet
     ReadOnly = $readOnly
     PendingSavePath = $null
+    SavedPath = $null
   }
 }
 
 function Close-ExcelContext($ctx) {
+  # Sets $ctx.SavedPath to the file actually written, or leaves it $null when
+  # the workbook was never modified and nothing needed saving. Excel is quit
+  # and released even if the save fails, so no hidden EXCEL.EXE is left behind.
   if ($null -eq $ctx) { return }
-  if ($ctx.ReadOnly) {
-    if ($null -ne $ctx.PendingSavePath) {
-      $ctx.Workbook.SaveAs($ctx.PendingSavePath)
+  try {
+    if ($ctx.ReadOnly) {
+      if ($null -ne $ctx.PendingSavePath -and -not $ctx.Workbook.Saved) {
+        # The pending name is new and timestamped, and Excel writes SaveAs
+        # through its own temporary file just like Save().
+        $ctx.Workbook.SaveAs($ctx.PendingSavePath, $ctx.Workbook.FileFormat)
+        $ctx.SavedPath = $ctx.PendingSavePath
+      }
+    }
+    elseif (-not $ctx.Workbook.Saved) {
+      $ctx.Workbook.Save()
+      $ctx.SavedPath = $ctx.Workbook.FullName
     }
   }
-  else {
-    $ctx.Workbook.Save()
+  finally {
+    try {
+      $ctx.Workbook.Close($false)
+    }
+    finally {
+      $ctx.Excel.Quit()
+      [System.Runtime.InteropServices.Marshal]::ReleaseComObject($ctx.Worksheet) | Out-Null
+      [System.Runtime.InteropServices.Marshal]::ReleaseComObject($ctx.Workbook) | Out-Null
+      [System.Runtime.InteropServices.Marshal]::ReleaseComObject($ctx.Excel) | Out-Null
+    }
   }
-  $ctx.Workbook.Close($false)
-  $ctx.Excel.Quit()
-  [System.Runtime.InteropServices.Marshal]::ReleaseComObject($ctx.Worksheet) | Out-Null
-  [System.Runtime.InteropServices.Marshal]::ReleaseComObject($ctx.Workbook) | Out-Null
-  [System.Runtime.InteropServices.Marshal]::ReleaseComObject($ctx.Excel) | Out-Null
 }
 
 function Ensure-Headers($worksheet) {
@@ -171,47 +253,45 @@ function Ensure-Headers($worksheet) {
     "Due Date" = "Bid Due Date"
     "Status" = "Bid Status"
   }
-  $headers = @{}
+  $cells = $worksheet.Cells
+  $original = Get-RangeText $worksheet 1 1 1 30
+  $values = $original.Clone()
   $hasAny = $false
   for ($col = 1; $col -le 30; $col++) {
-    $value = $worksheet.Cells.Item(1, $col).Text
+    $value = $values[$col - 1]
     if (![string]::IsNullOrWhiteSpace($value)) {
       $canonical = if ($legacyHeaderMap.ContainsKey($value)) { $legacyHeaderMap[$value] } else { $value }
-      if ($canonical -ne $value) {
-        $worksheet.Cells.Item(1, $col).Value2 = $canonical
-      }
-      if (-not $headers.ContainsKey($canonical)) {
-        $headers[$canonical] = $col
-      }
+      $values[$col - 1] = $canonical
       $hasAny = $true
     }
   }
   if (-not $hasAny) {
     for ($i = 0; $i -lt $HeaderDefaults.Count; $i++) {
-      $worksheet.Cells.Item(1, $i + 1).Value2 = $HeaderDefaults[$i]
-      $headers[$HeaderDefaults[$i]] = $i + 1
+      $cells.Item(1, $i + 1).Value2 = $HeaderDefaults[$i]
     }
-    return $headers
+    return $DefaultHeaderIndex.Clone()
   }
 
   $needsReorder = $false
   for ($i = 0; $i -lt $HeaderDefaults.Count; $i++) {
-    $current = $worksheet.Cells.Item(1, $i + 1).Text
-    if ($current -ne $HeaderDefaults[$i]) {
+    if ($values[$i] -ne $HeaderDefaults[$i]) {
       $needsReorder = $true
       break
     }
   }
   if ($needsReorder) {
     for ($i = 0; $i -lt $HeaderDefaults.Count; $i++) {
-      $worksheet.Cells.Item(1, $i + 1).Value2 = $HeaderDefaults[$i]
+      $values[$i] = $HeaderDefaults[$i]
     }
   }
-  $headers = @{}
-  for ($i = 0; $i -lt $HeaderDefaults.Count; $i++) {
-    $headers[$HeaderDefaults[$i]] = $i + 1
+  # Legacy renames and the reorder are settled in memory first, so each header
+  # cell is written at most once and only if its text actually changes.
+  for ($col = 1; $col -le 30; $col++) {
+    if ($values[$col - 1] -ne $original[$col - 1]) {
+      $cells.Item(1, $col).Value2 = $values[$col - 1]
+    }
   }
-  return $headers
+  return $DefaultHeaderIndex.Clone()
 }
 
 function Get-LastRow($worksheet) {
@@ -220,43 +300,159 @@ function Get-LastRow($worksheet) {
   return $used.Rows.Count
 }
 
+function Get-RangeText($worksheet, [int]$firstRow, [int]$firstCol, [int]$lastRow, [int]$lastCol) {
+  # Reads a single row or column with one COM call; Value2 hands back a
+  # 1-based [row, col] array (or a scalar for a single cell).
+  $cells = $worksheet.Cells
+  $raw = $worksheet.Range($cells.Item($firstRow, $firstCol), $cells.Item($lastRow, $lastCol)).Value2
+  $text = New-Object string[] (($lastRow - $firstRow + 1) * ($lastCol - $firstCol + 1))
+  if ($raw -is [array]) {
+    $i = 0
+    foreach ($value in $raw) {
+      if ($null -ne $value) { $text[$i] = [string]$value }
+      $i++
+    }
+  }
+  elseif ($null -ne $raw) {
+    $text[0] = [string]$raw
+  }
+  return ,$text
+}
+
 function Get-CellText($worksheet, [int]$row, [int]$col) {
   $value = $worksheet.Cells.Item($row, $col).Text
   if ($null -eq $value) { return "" }
   return $value.ToString().Trim()
 }
 
-function Get-RowIndexByBidNumber($worksheet, $headers, [string]$bidNumber) {
+function Get-RowIndexByBidNumber($worksheet, $headers, [string]$bidNumber, [int]$lastRow = 0) {
+  # Callers that already know the last row pass it to skip the UsedRange query.
   $col = $headers["Bid Number"]
-  $lastRow = Get-LastRow $worksheet
-  for ($row = 2; $row -le $lastRow; $row++) {
-    $value = $worksheet.Cells.Item($row, $col).Text
-    if ($value -eq $bidNumber) { return $row }
+  if ($lastRow -le 0) { $lastRow = Get-LastRow $worksheet }
+  if ($lastRow -lt 2) { return $null }
+  $values = Get-RangeText $worksheet 2 $col $lastRow $col
+  for ($i = 0; $i -lt $values.Count; $i++) {
+    if ($values[$i] -eq $bidNumber) { return $i + 2 }
   }
   return $null
 }
 
-function Get-RowIndexByFolder($worksheet, $headers, [string]$folderName) {
-  $col = $headers["Bid Folder"]
-  $lastRow = Get-LastRow $worksheet
-  for ($row = 2; $row -le $lastRow; $row++) {
-    $value = $worksheet.Cells.Item($row, $col).Text
-    if ($value -eq $folderName) { return $row }
+function Get-BidRowIndex($worksheet, $columns, [int]$lastRow) {
+  # Reads the six bid columns in one Range.Value2 call and indexes bid numbers
+  # and folders in a single pass. First row wins, matching the top-down
+  # search of Get-RowIndexByBidNumber. KeysByRow records each row's own
+  # (bid number, folder) pair so callers can drop keys a rewrite makes stale;
+  # Values keeps the block for Test-BidRowCurrent.
+  $byBidNumber = @{}
+  $byFolder = @{}
+  $keysByRow = @{}
+  $indexes = @($columns.Folder, $columns.BidNumber, $columns.Initials, $columns.BidDate, $columns.Customer, $columns.BidName)
+  $firstCol = ($indexes | Measure-Object -Minimum).Minimum
+  $lastCol = ($indexes | Measure-Object -Maximum).Maximum
+  $raw = $null
+  if ($lastRow -ge 2) {
+    $numberIdx = $columns.BidNumber - $firstCol + 1
+    $folderIdx = $columns.Folder - $firstCol + 1
+    $cells = $worksheet.Cells
+    $raw = $worksheet.Range($cells.Item(2, $firstCol), $cells.Item($lastRow, $lastCol)).Value2
+    for ($i = 1; $i -le $lastRow - 1; $i++) {
+      $number = [string]$raw[$i, $numberIdx]
+      if (![string]::IsNullOrEmpty($number) -and -not $byBidNumber.ContainsKey($number)) {
+        $byBidNumber[$number] = $i + 1
+      }
+      $folder = [string]$raw[$i, $folderIdx]
+      if (![string]::IsNullOrEmpty($folder) -and -not $byFolder.ContainsKey($folder)) {
+        $byFolder[$folder] = $i + 1
+      }
+      $keysByRow[$i + 1] = @($number, $folder)
+    }
+  }
+  return [pscustomobject]@{
+    ByBidNumber = $byBidNumber
+    ByFolder = $byFolder
+    KeysByRow = $keysByRow
+    Values = $raw
+    FirstCol = $firstCol
+    LastRow = $lastRow
   }
-  return $null
 }
 
-function Write-Row($worksheet, $headers, $row, $bidInfo) {
-  $worksheet.Cells.Item($row, $headers["Bid Folder"]).Value2 = $bidInfo.Folder
-  $worksheet.Cells.Item($row, $headers["Bid Number"]).Value2 = $bidInfo.BidNumber
-  $worksheet.Cells.Item($row, $headers["Estimator"]).Value2 = $bidInfo.Initials
-  $worksheet.Cells.Item($row, $headers["Bid Due Date"]).Value2 = $bidInfo.BidDate
-  $worksheet.Cells.Item($row, $headers["Customer/GC"]).Value2 = $bidInfo.Customer
-  $worksheet.Cells.Item($row, $headers["Bid Name"]).Value2 = $bidInfo.BidName
+function Test-CellValue($value, [string]$expected) {
+  # Value2 returns what Excel made of the text Write-Row assigned: numeric text
+  # comes back as a double and MM-DD text as a date serial.
+  if ($null -eq $value) { return [string]::IsNullOrEmpty($expected) }
+  if ($value -is [double]) {
+    if ([string]$value -eq $expected) { return $true }
+    if (-not $BidDateRegex.IsMatch($expected) -or $value -lt 1 -or $value -ge 2958466) { return $false }
+    $date = [DateTime]::FromOADate($value)
+    return (("{0:D2}-{1:D2}" -f $date.Month, $date.Day) -eq (Normalize-BidDate $expected))
+  }
+  return (([string]$value) -ceq $expected)
 }
 
-function Sync-BidWorkbook {
-  if (!(Test-Path $WorkbookPath)) { throw "Workbook not found: $WorkbookPath" }
+function Test-BidRowCurrent($index, $columns, [int]$row, $bidInfo) {
+  # True when the row's six bid cells already hold what Write-Row would write,
+  # so it can be skipped and the workbook stays unmodified.
+  if ($null -eq $index.Values -or $row -gt $index.LastRow) { return $false }
+  $values = $index.Values
+  $i = $row - 1
+  $offset = 1 - $index.FirstCol
+  return ((Test-CellValue $values[$i, ($columns.Folder + $offset)] $bidInfo.Folder) -and
+    (Test-CellValue $values[$i, ($columns.BidNumber + $offset)] $bidInfo.BidNumber) -and
+    (Test-CellValue $values[$i, ($columns.Initials + $offset)] $bidInfo.Initials) -and
+    (Test-CellValue $values[$i, ($columns.BidDate + $offset)] $bidInfo.BidDate) -and
+    (Test-CellValue $values[$i, ($columns.Customer + $offset)] $bidInfo.Customer) -and
+    (Test-CellValue $values[$i, ($columns.BidName + $offset)] $bidInfo.BidName))
+}
+
+function Get-BidColumns($headers) {
+  # Resolved once per sync so the per-row writers skip the header lookups.
+  return [pscustomobject]@{
+    Folder    = $headers["Bid Folder"]
+    BidNumber = $headers["Bid Number"]
+    Initials  = $headers["Estimator"]
+    BidDate   = $headers["Bid Due Date"]
+    Customer  = $headers["Customer/GC"]
+    BidName   = $headers["Bid Name"]
+  }
+}
+
+function Write-Row($worksheet, $columns, $row, $bidInfo) {
+  $cells = $worksheet.Cells
+  $cells.Item($row, $columns.Folder).Value2 = $bidInfo.Folder
+  $cells.Item($row, $columns.BidNumber).Value2 = $bidInfo.BidNumber
+  $cells.Item($row, $columns.Initials).Value2 = $bidInfo.Initials
+  $cells.Item($row, $columns.BidDate).Value2 = $bidInfo.BidDate
+  $cells.Item($row, $columns.Customer).Value2 = $bidInfo.Customer
+  $cells.Item($row, $columns.BidName).Value2 = $bidInfo.BidName
+}
+
+function Write-NewRows($worksheet, $columns, [int]$firstRow, $bidInfos) {
+  # Appended rows are contiguous, so they go out as one Range.Value2
+  # assignment instead of six COM writes per row.
+  if ($bidInfos.Count -eq 0) { return }
+  $indexes = @($columns.Folder, $columns.BidNumber, $columns.Initials, $columns.BidDate, $columns.Customer, $columns.BidName)
+  $firstCol = ($indexes | Measure-Object -Minimum).Minimum
+  $lastCol = ($indexes | Measure-Object -Maximum).Maximum
+  $block = New-Object 'object[,]' $bidInfos.Count, ($lastCol - $firstCol + 1)
+  for ($i = 0; $i -lt $bidInfos.Count; $i++) {
+    $info = $bidInfos[$i]
+    $block[$i, ($columns.Folder - $firstCol)] = $info.Folder
+    $block[$i, ($columns.BidNumber - $firstCol)] = $info.BidNumber
+    $block[$i, ($columns.Initials - $firstCol)] = $info.Initials
+    $block[$i, ($columns.BidDate - $firstCol)] = $info.BidDate
+    $block[$i, ($columns.Customer - $firstCol)] = $info.Customer
+    $block[$i, ($columns.BidName - $firstCol)] = $info.BidName
+  }
+  $cells = $worksheet.Cells
+  $lastRow = $firstRow + $bidInfos.Count - 1
+  $worksheet.Range($cells.Item($firstRow, $firstCol), $cells.Item($lastRow, $lastCol)).Value2 = $block
+}
+
+function Update-BidWorkbookRows([string[]]$folderNames) {
+  # Upserts one row per parsable folder name and saves the workbook. Returns
+  # $false when the changes went to a pending-update copy, i.e. the workbook
+  # on disk is still missing them.
   $ctx = New-ExcelContext -path $WorkbookPath
   try {
     if ($ctx.ReadOnly) {
@@ -264,40 +460,83 @@ function Sync-BidWorkbook {
     }
     $worksheet = $ctx.Worksheet
     $headers = Ensure-Headers $worksheet
+    $columns = Get-BidColumns $headers
     $lastRow = Get-LastRow $worksheet
-
-    foreach ($folder in (Get-BidFolders)) {
-      $info = Parse-BidFolderName $folder.Name
+    $index = Get-BidRowIndex $worksheet $columns $lastRow
+    $rowsByBidNumber = $index.ByBidNumber
+    $rowsByFolder = $index.ByFolder
+    $keysByRow = $index.KeysByRow
+    # Rows rewritten during this sync no longer match the values $index read.
+    $rewrittenRows = @{}
+    $firstNewRow = $lastRow + 1
+    $newRows = New-Object System.Collections.Generic.List[object]
+
+    foreach ($folderName in $folderNames) {
+      $info = Parse-BidFolderName $folderName
       if ($null -eq $info) { continue }
 
-      $row = Get-RowIndexByBidNumber $worksheet $headers $info.BidNumber
+      $row = $rowsByBidNumber[$info.BidNumber]
       if ($null -eq $row) {
-        $row = Get-RowIndexByFolder $worksheet $headers $info.Folder
+        $row = $rowsByFolder[$info.Folder]
       }
       if ($null -eq $row) {
         $lastRow++
         $row = $lastRow
+        $newRows.Add($info)
+      }
+      elseif ($row -ge $firstNewRow) {
+        $newRows[$row - $firstNewRow] = $info
+      }
+      elseif ($rewrittenRows.ContainsKey($row) -or -not (Test-BidRowCurrent $index $columns $row $info)) {
+        Write-Row $worksheet $columns $row $info
+        $rewrittenRows[$row] = $true
       }
-      Write-Row $worksheet $headers $row $info
+      # The row now holds this folder's keys. Drop the keys it held before so a
+      # later folder with the old bid number appends instead of landing here.
+      $oldKeys = $keysByRow[$row]
+      if ($null -ne $oldKeys) {
+        if ($oldKeys[0] -ne $info.BidNumber -and $rowsByBidNumber[$oldKeys[0]] -eq $row) { $rowsByBidNumber.Remove($oldKeys[0]) }
+        if ($oldKeys[1] -ne $info.Folder -and $rowsByFolder[$oldKeys[1]] -eq $row) { $rowsByFolder.Remove($oldKeys[1]) }
+      }
+      $keysByRow[$row] = @($info.BidNumber, $info.Folder)
+      if (-not $rowsByBidNumber.ContainsKey($info.BidNumber)) { $rowsByBidNumber[$info.BidNumber] = $row }
+      if (-not $rowsByFolder.ContainsKey($info.Folder)) { $rowsByFolder[$info.Folder] = $row }
     }
+    Write-NewRows $worksheet $columns $firstNewRow $newRows
   }
   finally {
     Close-ExcelContext $ctx
   }
 
-  if ($ctx.ReadOnly -and $null -ne $ctx.PendingSavePath) {
+  if ($null -eq $ctx.SavedPath) {
+    Write-Host "Workbook already matches the current bid folders." -ForegroundColor Green
+  }
+  elseif ($ctx.SavedPath -eq $ctx.PendingSavePath) {
     Write-Host "Workbook is open by another user; saved updates to:" -ForegroundColor Yellow
     Write-Host $ctx.PendingSavePath -ForegroundColor Yellow
   }
   else {
     Write-Host "Workbook updated with current bid folders." -ForegroundColor Green
   }
+  return (-not $ctx.ReadOnly -or $null -eq $ctx.SavedPath)
+}
+
+function Sync-BidWorkbook {
+  if (!(Test-Path $WorkbookPath)) { throw "Workbook not found: $WorkbookPath" }
+  Update-BidWorkbookRows (Get-BidFolderNames)
+}
+
+function Sync-BidWorkbookIncremental([string[]]$folderNames) {
+  # For folders just created by this script, when the workbook on disk is
+  # otherwise current: skip listing and parsing every other bid folder.
+  if (!(Test-Path $WorkbookPath)) { throw "Workbook not found: $WorkbookPath" }
+  Update-BidWorkbookRows $folderNames
 }
 
 function Update-BidStatus {
   if (!(Test-Path $WorkbookPath)) { throw "Workbook not found: $WorkbookPath" }
   $bidNumber = Read-NonEmpty "Enter bid number to update"
-  $status = (Read-Host "Status (leave blank to keep current)").Trim()
+  $status = (Read-Prompt "Status (leave blank to keep current)").Trim()
   $award = ""
   $proposalAmount = ""
   $proposalDate = ""
@@ -309,18 +548,19 @@ function Update-BidStatus {
     }
     $worksheet = $ctx.Worksheet
     $headers = Ensure-Headers $worksheet
-    $row = Get-RowIndexByBidNumber $worksheet $headers $bidNumber
+    $lastRow = Get-LastRow $worksheet
+    $row = Get-RowIndexByBidNumber $worksheet $headers $bidNumber $lastRow
     if ($null -eq $row) { throw "Bid number not found in workbook: $bidNumber" }
 
     if ($headers.ContainsKey("Proposal Amount")) {
       $currentAmount = Get-CellText $worksheet $row $headers["Proposal Amount"]
       if (![string]::IsNullOrWhiteSpace($currentAmount)) {
         if (Read-YesNoDefaultNo ("Proposal Amount is '{0}'. Update it?" -f $currentAmount)) {
-          $proposalAmount = (Read-Host "Proposal Amount").Trim()
+          $proposalAmount = (Read-Prompt "Proposal Amount").Trim()
         }
       }
       else {
-        $proposalAmount = (Read-Host "Proposal Amount (leave blank to skip)").Trim()
+        $proposalAmount = (Read-Prompt "Proposal Amount (leave blank to skip)").Trim()
       }
     }
 
@@ -328,16 +568,16 @@ function Update-BidStatus {
       $currentDate = Get-CellText $worksheet $row $headers["Proposal Date"]
       if (![string]::IsNullOrWhiteSpace($currentDate)) {
         if (Read-YesNoDefaultNo ("Proposal Date is '{0}'. Update it?" -f $currentDate)) {
-          $proposalDate = (Read-Host "Proposal Date (MM-DD or date string)").Trim()
+          $proposalDate = (Read-Prompt "Proposal Date (MM-DD or date string)").Trim()
         }
       }
       else {
-        $proposalDate = (Read-Host "Proposal Date (leave blank to skip)").Trim()
+        $proposalDate = (Read-Prompt "Proposal Date (leave blank to skip)").Trim()
       }
     }
 
     if ($headers.ContainsKey("Award")) {
-      $award = (Read-Host "Award (leave blank to keep current)").Trim()
+      $award = (Read-Prompt "Award (leave blank to keep current)").Trim()
     }
     if (-not [string]::IsNullOrWhiteSpace($proposalAmount)) {
       $worksheet.Cells.Item($row, $headers["Proposal Amount"]).Value2 = $proposalAmount
@@ -356,7 +596,7 @@ function Update-BidStatus {
     Close-ExcelContext $ctx
   }
 
-  if ($ctx.ReadOnly -and $null -ne $ctx.PendingSavePath) {
+  if ($null -ne $ctx.PendingSavePath -and $ctx.SavedPath -eq $ctx.PendingSavePath) {
     Write-Host "Workbook is open by another user; saved updates to:" -ForegroundColor Yellow
     Write-Host $ctx.PendingSavePath -ForegroundColor Yellow
   }
@@ -365,17 +605,52 @@ function Update-BidStatus {
   }
 }
 
+function Start-BidWorkbookSync([string[]]$folderNames) {
+  # Runs this script with -SyncOnly in a background job so Excel's open and
+  # save overlap with the interactive work. Without folder names it is a full
+  # Sync-BidWorkbook; with them, Sync-BidWorkbookIncremental.
+  # Checked here so a missing workbook fails before any prompting starts.
+  if (!(Test-Path $WorkbookPath)) { throw "Workbook not found: $WorkbookPath" }
+  # Windows PowerShell starts jobs in $HOME\Documents, so relative paths must
+  # be resolved against the caller's location before they are handed over.
+  $paths = $ExecutionContext.SessionState.Path
+  $params = @{
+    BidRoot = $paths.GetUnresolvedProviderPathFromPSPath($BidRoot)
+    TemplateRoot = $paths.GetUnresolvedProviderPathFromPSPath($TemplateRoot)
+    WorkbookPath = $paths.GetUnresolvedProviderPathFromPSPath($WorkbookPath)
+    WorksheetName = $WorksheetName
+    SyncOnly = $true
+  }
+  if ($folderNames) { $params.SyncFolderNames = $folderNames }
+  return Start-Job -ScriptBlock {
+    param($scriptPath, $params)
+    & $scriptPath @params
+  } -ArgumentList $PSCommandPath, $params
+}
+
+function Wait-BidWorkbookSync($job) {
+  # Replays the job's host output here and returns the sync's result; a
+  # failed sync surfaces as an error.
+  return (@(Receive-Job -Job $job -Wait -AutoRemoveJob) | Select-Object -Last 1)
+}
+
 function New-BidFolder {
   Assert-Paths
 
-  Sync-BidWorkbook
-
-  $initials   = Read-NonEmpty "Estimator initials (ex: MD)"
-  $bidDateRaw = Read-NonEmpty "Bid Due Date (MM-DD, ex: 12-5)"
-  $customer   = Read-NonEmpty "Customer/GC"
-  $bidName    = Read-NonEmpty "Bid Name"
+  # The pre-create sync runs while the user answers the prompts. It is waited
+  # on before anything is created, so a failed sync still stops here.
+  $syncJob = Start-BidWorkbookSync
+  try {
+    $initials   = Read-NonEmpty "Estimator initials (ex: MD)"
+    $bidDateRaw = Read-NonEmpty "Bid Due Date (MM-DD, ex: 12-5)"
+    $customer   = Read-NonEmpty "Customer/GC"
+    $bidName    = Read-NonEmpty "Bid Name"
 
-  $bidDate = Normalize-BidDate $bidDateRaw
+    $bidDate = Normalize-BidDate $bidDateRaw
+  }
+  finally {
+    $workbookCurrent = [bool](Wait-BidWorkbookSync $syncJob)
+  }
   $newNum = Get-NextBidNumber
 
   $newFolderName = Build-BidFolderName $newNum $initials $bidDate $customer $bidName
@@ -386,9 +661,12 @@ function New-BidFolder {
 
   $copyTemplate = Read-YesNoDefaultNo "Copy subfolder structure from the template?"
   if ($copyTemplate) {
-    Copy-Item -Path (Join-Path $TemplateRoot '*') -Destination $dest -Recurse -Force -Exclude 'Thumbs.db'
-    Get-ChildItem -Path $dest -Filter "Thumbs.db" -Recurse -Force -ErrorAction SilentlyContinue |
-      Remove-Item -Force -ErrorAction SilentlyContinue
+    # One robocopy pass copies the whole tree and skips Thumbs.db at the source
+    # (at any depth), so there is nothing to clean up afterwards. A trailing
+    # backslash would reach robocopy as an escaped closing quote.
+    $templateSource = $TemplateRoot.TrimEnd('\')
+    robocopy $templateSource $dest /E /XF Thumbs.db /R:1 /W:1 /NFL /NDL /NJH /NJS /NP | Out-Null
+    if ($LASTEXITCODE -ge 8) { throw "Template copy failed (robocopy exit code $LASTEXITCODE): $TemplateRoot" }
   }
 
   Write-Host "" 
@@ -396,11 +674,17 @@ function New-BidFolder {
   Write-Host $dest -ForegroundColor Green
   Write-Host ""
 
+  $syncJob = $null
   if (Read-YesNoDefaultNo "Update the bid list workbook now?") {
-    Sync-BidWorkbook
+    # If the pre-create sync could only write a pending-update copy, the
+    # workbook on disk is still behind, so the next pending copy must come
+    # from a full sync to be complete.
+    if ($workbookCurrent) { $syncJob = Start-BidWorkbookSync @($newFolderName) }
+    else { $syncJob = Start-BidWorkbookSync }
   }
 
   Start-Process explorer.exe $dest
+  if ($null -ne $syncJob) { $null = Wait-BidWorkbookSync $syncJob }
 }
 
 function Show-Menu {
@@ -412,12 +696,18 @@ function Show-Menu {
   Write-Host "4) Exit"
 }
 
+if ($SyncOnly) {
+  if ($SyncFolderNames) { Sync-BidWorkbookIncremental $SyncFolderNames }
+  else { Sync-BidWorkbook }
+  return
+}
+
 :main while ($true) {
   Show-Menu
-  $choice = (Read-Host "Choose an option (1-4)").Trim()
+  $choice = (Read-Prompt "Choose an option (1-4)").Trim()
   switch ($choice) {
     '1' { New-BidFolder }
-    '2' { Sync-BidWorkbook }
+    '2' { Sync-BidWorkbook | Out-Null }
     '3' { Update-BidStatus }
     '4' { break main }
     default { Write-Host "Invalid option. Choose 1-4." -ForegroundColor Yellow }